@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.contrib import admin
 from django.contrib.auth.admin import GroupAdmin as BaseGroupAdmin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
@@ -9,9 +11,38 @@ from unfold.decorators import display
 from unfold.forms import AdminPasswordChangeForm, UserChangeForm, UserCreationForm
 
 from .models import User
+from .pagination import FasterAdminPaginator
 
 admin.site.unregister(Group)
 
+_AVATAR_IMG_TMPL = (
+    '<div style="display: flex; align-items: center; gap: 10px;">'
+    '<img src="{}" width="40" height="40" style="border-radius: 50%; object-fit: cover;" />'
+    '<div><strong>{}</strong><br><span style="color: #666; font-size: 12px;">{}</span></div>'
+    "</div>"
+)
+
+_AVATAR_INITIAL_TMPL = (
+    '<div style="display: flex; align-items: center; gap: 10px;">'
+    '<div style="width: 40px; height: 40px; border-radius: 50%; background: #e5e7eb; display: flex; align-items: center; justify-content: center; color: #9ca3af; font-weight: bold;">{}</div>'
+    '<div><strong>{}</strong><br><span style="color: #666; font-size: 12px;">{}</span></div>'
+    "</div>"
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_avatar(picture_url, name, email):
+    # Output depends only on the arguments, so rendered rows can be shared
+    # between changelist requests
+    if picture_url and picture_url.startswith("http"):
+        return format_html(_AVATAR_IMG_TMPL, picture_url, name, email)
+    return format_html(
+        _AVATAR_INITIAL_TMPL,
+        name[0].upper() if name else "?",
+        name,
+        email,
+    )
+
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin, ModelAdmin):
@@ -31,6 +62,9 @@ class UserAdmin(BaseUserAdmin, ModelAdmin):
     list_display_links = ["display_avatar", "username"]
     search_fields = ["username", "email", "first_name", "last_name"]
     list_filter = ["is_staff", "is_superuser", "is_active", "groups"]
+    list_per_page = 25
+    show_full_result_count = False
+    paginator = FasterAdminPaginator
 
     fieldsets = (
         (None, {"fields": ("username", "password")}),
@@ -64,27 +98,7 @@ class UserAdmin(BaseUserAdmin, ModelAdmin):
     @display(description=_("User"))
     def display_avatar(self, instance):
         name = instance.get_full_name() or instance.username
-        if instance.profile_picture_url and instance.profile_picture_url.startswith(
-            "http"
-        ):
-            return format_html(
-                '<div style="display: flex; align-items: center; gap: 10px;">'
-                '<img src="{}" width="40" height="40" style="border-radius: 50%; object-fit: cover;" />'
-                '<div><strong>{}</strong><br><span style="color: #666; font-size: 12px;">{}</span></div>'
-                "</div>",
-                instance.profile_picture_url,
-                name,
-                instance.email or "-",
-            )
-        return format_html(
-            '<div style="display: flex; align-items: center; gap: 10px;">'
-            '<div style="width: 40px; height: 40px; border-radius: 50%; background: #e5e7eb; display: flex; align-items: center; justify-content: center; color: #9ca3af; font-weight: bold;">{}</div>'
-            '<div><strong>{}</strong><br><span style="color: #666; font-size: 12px;">{}</span></div>'
-            "</div>",
-            name[0].upper() if name else "?",
-            name,
-            instance.email or "-",
-        )
+        return _render_avatar(instance.profile_picture_url, name, instance.email or "-")
 
     @display(
         description=_("Staff"),
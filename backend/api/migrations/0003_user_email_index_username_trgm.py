@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:11
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("api", "0002_user_profile_picture_user_profile_picture_url"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(fields=["email"], name="users_email_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="gin_trgm_ops",
+                ),
+                name="users_username_upper_trgm_idx",
+            ),
+        ),
+    ]
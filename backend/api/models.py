@@ -1,9 +1,12 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 
 class User(AbstractUser):
+    email = models.EmailField(_("email address"), blank=True)
     profile_picture = models.ImageField(
         _("Profile Picture"),
         upload_to="profile_pictures/",
@@ -23,6 +26,35 @@ class User(AbstractUser):
         db_table = "users"
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            models.Index(fields=["email"], name="users_email_idx"),
+            # Speeds up the admin's icontains search on username, which
+            # PostgreSQL runs as UPPER(username) LIKE UPPER(...)
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="users_username_upper_trgm_idx",
+            ),
+        ]
+
+    # Stored profile picture name, used to detect new uploads on save
+    _original_profile_picture = None
 
     def __str__(self):
         return self.email if self.email else self.username
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_profile_picture()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        if fields is None or "profile_picture" in fields:
+            self.remember_profile_picture()
+
+    def remember_profile_picture(self):
+        """Treat the current profile picture as the one in the database."""
+        picture = self.__dict__.get("profile_picture")
+        # A name when loaded, a FieldFile once the field has been accessed
+        self._original_profile_picture = getattr(picture, "name", picture)
@@ -1,3 +1,4 @@
+import sys
 from os import environ
 from pathlib import Path
 
@@ -10,11 +11,23 @@ from django.utils.translation import gettext_lazy as _
 # Sentry / BugSink
 ######################################################################
 SENTRY_DSN = environ.get("SENTRY_DSN", "")
+
+# Management commands and non-web processes (PROCESS_TYPE) keep error
+# reporting but are not traced
+SENTRY_TRACE_PROCESS = environ.get("PROCESS_TYPE", "web") == "web" and (
+    Path(sys.argv[0]).name != "manage.py" or sys.argv[1:2] == ["runserver"]
+)
+
 if SENTRY_DSN:
     sentry_sdk.init(
         dsn=SENTRY_DSN,
-        traces_sample_rate=0.1,
-        send_default_pii=True,
+        traces_sample_rate=(
+            float(environ.get("SENTRY_TRACES_SAMPLE_RATE", 0.1))
+            if SENTRY_TRACE_PROCESS
+            else 0.0
+        ),
+        profiles_sample_rate=float(environ.get("SENTRY_PROFILES_SAMPLE_RATE", 0.0)),
+        send_default_pii=environ.get("SENTRY_SEND_DEFAULT_PII", "") == "1",
     )
 
 ######################################################################
@@ -45,6 +58,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "drf_spectacular",
@@ -64,6 +78,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "settings_config.middleware.SingletonPreloadMiddleware",
 ]
 
 ######################################################################
@@ -96,6 +111,11 @@ DATABASES = {
         "NAME": environ.get("DATABASE_NAME", "db"),
         "HOST": environ.get("DATABASE_HOST", "db"),
         "PORT": "5432",
+        # Reuse connections across requests instead of reconnecting each time
+        "CONN_MAX_AGE": int(environ.get("CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+        # Required when connecting through PgBouncer in transaction pooling mode
+        "DISABLE_SERVER_SIDE_CURSORS": environ.get("DATABASE_PGBOUNCER", "") == "1",
         "TEST": {
             "NAME": "test",
         },
@@ -143,7 +163,7 @@ STATIC_URL = "static/"
 ######################################################################
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.FastPageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -157,6 +177,75 @@ REST_FRAMEWORK = {
 ######################################################################
 # Unfold
 ######################################################################
+# Sidebar items. Unfold writes per-request state ("active", permission and
+# badge callbacks) into these dicts and reassigns each group's "items" list,
+# so they are plain mutable lists and dicts like the rest of UNFOLD.
+_NAV_MAIN = [
+    {
+        "title": _("Users"),
+        "icon": "person",
+        "link": reverse_lazy("admin:api_user_changelist"),
+    },
+    {
+        "title": _("Groups"),
+        "icon": "label",
+        "link": reverse_lazy("admin:auth_group_changelist"),
+    },
+]
+
+_NAV_BLOG = [
+    {
+        "title": _("Posts"),
+        "icon": "article",
+        "link": reverse_lazy("admin:blog_post_changelist"),
+    },
+    {
+        "title": _("Categories"),
+        "icon": "category",
+        "link": reverse_lazy("admin:blog_category_changelist"),
+    },
+    {
+        "title": _("Tags"),
+        "icon": "label",
+        "link": reverse_lazy("admin:blog_tag_changelist"),
+    },
+    {
+        "title": _("Subscribers"),
+        "icon": "group",
+        "link": reverse_lazy("admin:blog_newslettersubscriber_changelist"),
+    },
+    {
+        "title": _("Newsletters"),
+        "icon": "mail",
+        "link": reverse_lazy("admin:blog_newsletter_changelist"),
+    },
+]
+
+_NAV_SETTINGS = [
+    {
+        "title": _("Stripe"),
+        "icon": "credit_card",
+        "link": reverse_lazy("admin:settings_config_stripeconfiguration_changelist"),
+    },
+    {
+        "title": _("Resend (Email)"),
+        "icon": "mail",
+        "link": reverse_lazy("admin:settings_config_resendconfiguration_changelist"),
+    },
+    {
+        "title": _("TinyMCE (Editor)"),
+        "icon": "edit_note",
+        "link": reverse_lazy("admin:settings_config_tinymceconfiguration_changelist"),
+    },
+    {
+        "title": _("Cloudinary (Media)"),
+        "icon": "cloud_upload",
+        "link": reverse_lazy(
+            "admin:settings_config_cloudinaryconfiguration_changelist"
+        ),
+    },
+]
+
 UNFOLD = {
     "SITE_HEADER": _("Turbo Admin"),
     "SITE_TITLE": _("Turbo Admin"),
@@ -167,85 +256,17 @@ UNFOLD = {
             {
                 "title": _("Navigation"),
                 "separator": False,
-                "items": [
-                    {
-                        "title": _("Users"),
-                        "icon": "person",
-                        "link": reverse_lazy("admin:api_user_changelist"),
-                    },
-                    {
-                        "title": _("Groups"),
-                        "icon": "label",
-                        "link": reverse_lazy("admin:auth_group_changelist"),
-                    },
-                ],
+                "items": _NAV_MAIN,
             },
             {
                 "title": _("Blog & Newsletter"),
                 "separator": True,
-                "items": [
-                    {
-                        "title": _("Posts"),
-                        "icon": "article",
-                        "link": reverse_lazy("admin:blog_post_changelist"),
-                    },
-                    {
-                        "title": _("Categories"),
-                        "icon": "category",
-                        "link": reverse_lazy("admin:blog_category_changelist"),
-                    },
-                    {
-                        "title": _("Tags"),
-                        "icon": "label",
-                        "link": reverse_lazy("admin:blog_tag_changelist"),
-                    },
-                    {
-                        "title": _("Subscribers"),
-                        "icon": "group",
-                        "link": reverse_lazy(
-                            "admin:blog_newslettersubscriber_changelist"
-                        ),
-                    },
-                    {
-                        "title": _("Newsletters"),
-                        "icon": "mail",
-                        "link": reverse_lazy("admin:blog_newsletter_changelist"),
-                    },
-                ],
+                "items": _NAV_BLOG,
             },
             {
                 "title": _("System Settings"),
                 "separator": True,
-                "items": [
-                    {
-                        "title": _("Stripe"),
-                        "icon": "credit_card",
-                        "link": reverse_lazy(
-                            "admin:settings_config_stripeconfiguration_changelist"
-                        ),
-                    },
-                    {
-                        "title": _("Resend (Email)"),
-                        "icon": "mail",
-                        "link": reverse_lazy(
-                            "admin:settings_config_resendconfiguration_changelist"
-                        ),
-                    },
-                    {
-                        "title": _("TinyMCE (Editor)"),
-                        "icon": "edit_note",
-                        "link": reverse_lazy(
-                            "admin:settings_config_tinymceconfiguration_changelist"
-                        ),
-                    },
-                    {
-                        "title": _("Cloudinary (Media)"),
-                        "icon": "cloud_upload",
-                        "link": reverse_lazy(
-                            "admin:settings_config_cloudinaryconfiguration_changelist"
-                        ),
-                    },
-                ],
+                "items": _NAV_SETTINGS,
             },
         ],
     },
@@ -1,54 +1,64 @@
 import logging
 
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
-from settings_config.services import delete_from_cloudinary, upload_to_cloudinary
+from settings_config.services import is_cloudinary_configured, run_in_background
 
 from .models import User
+from .tasks import upload_profile_picture
 
 logger = logging.getLogger(__name__)
 
 
 @receiver(pre_save, sender=User)
-def upload_profile_picture_to_cloudinary(sender, instance, **kwargs):
+def mark_new_profile_picture(sender, instance, update_fields=None, **kwargs):
     """
-    Upload profile picture to Cloudinary when a new image is uploaded.
+    Mark a newly uploaded profile picture for upload to Cloudinary.
+
+    The picture is stored in the field as usual and replaced by its
+    Cloudinary URL in the background once the user has been saved, see
+    upload_profile_picture_to_cloudinary.
     """
-    if not instance.pk:
-        # New user, check if profile_picture is set
-        if instance.profile_picture:
-            url = upload_to_cloudinary(
-                instance.profile_picture,
-                folder="users/profile_pictures",
-            )
-            if url:
-                instance.profile_picture_url = url
-                # Clear the file field since we're using URL
-                instance.profile_picture = None
+    if update_fields is not None and "profile_picture" not in update_fields:
         return
 
-    # Existing user - check if profile_picture changed
-    try:
-        old_instance = User.objects.get(pk=instance.pk)
-    except User.DoesNotExist:
+    # Deferred and never assigned, so it cannot have changed
+    if "profile_picture" not in instance.__dict__:
         return
 
-    # If a new profile picture is being uploaded
+    # Compare against the picture loaded from the database
     if (
-        instance.profile_picture
-        and instance.profile_picture != old_instance.profile_picture
+        not instance.profile_picture
+        or instance.profile_picture == instance._original_profile_picture
     ):
-        # Delete old image from Cloudinary if exists
-        if old_instance.profile_picture_url:
-            delete_from_cloudinary(old_instance.profile_picture_url)
-
-        # Upload new image
-        url = upload_to_cloudinary(
-            instance.profile_picture,
-            folder="users/profile_pictures",
-        )
-        if url:
-            instance.profile_picture_url = url
-            # Clear the file field since we're using URL
-            instance.profile_picture = None
+        return
+
+    if not is_cloudinary_configured():
+        return
+
+    instance._pending_profile_picture_url = instance.profile_picture_url
+
+
+@receiver(post_save, sender=User)
+def upload_profile_picture_to_cloudinary(sender, instance, **kwargs):
+    """
+    Upload a newly stored profile picture to Cloudinary in the background.
+    """
+    old_url = instance.__dict__.pop("_pending_profile_picture_url", None)
+    if old_url is None:
+        return
+
+    run_in_background(
+        upload_profile_picture, instance.pk, instance.profile_picture.name, old_url
+    )
+
+
+@receiver(post_save, sender=User)
+def remember_saved_profile_picture(sender, instance, update_fields=None, **kwargs):
+    """
+    The saved picture is now the one in the database, so saving again
+    doesn't upload it twice.
+    """
+    if update_fields is None or "profile_picture" in update_fields:
+        instance.remember_profile_picture()
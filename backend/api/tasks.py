@@ -0,0 +1,30 @@
+from settings_config.services import delete_from_cloudinary, upload_to_cloudinary
+
+from .models import User
+
+
+def upload_profile_picture(user_id, name, old_url=""):
+    """
+    Upload a stored profile picture to Cloudinary and store its URL on the user.
+
+    The stored file is only removed once the URL has been saved, so a failed
+    or interrupted upload leaves the picture in place.
+    """
+    storage = User._meta.get_field("profile_picture").storage
+    with storage.open(name) as picture:
+        url = upload_to_cloudinary(picture, folder="users/profile_pictures")
+    if not url:
+        return
+
+    updated = User.objects.filter(pk=user_id, profile_picture=name).update(
+        profile_picture_url=url, profile_picture=None
+    )
+    if not updated:
+        # The picture was replaced meanwhile, its own upload takes over
+        delete_from_cloudinary(url)
+        return
+
+    storage.delete(name)
+    # Delete old image from Cloudinary once the new one is in place
+    if old_url:
+        delete_from_cloudinary(old_url)
@@ -0,0 +1,54 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from api import signals
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("configured", [False, True])
+def test_profile_picture_stored_before_upload(
+    regular_user,
+    configured,
+    monkeypatch,
+    settings,
+    tmp_path,
+    django_capture_on_commit_callbacks,
+):
+    settings.MEDIA_ROOT = tmp_path
+    monkeypatch.setattr(signals, "is_cloudinary_configured", lambda: configured)
+    scheduled = []
+    monkeypatch.setattr(
+        signals, "run_in_background", lambda *args: scheduled.append(args)
+    )
+
+    regular_user.profile_picture = SimpleUploadedFile("a.png", b"image")
+    regular_user.save()
+
+    regular_user.refresh_from_db()
+    assert regular_user.profile_picture.read() == b"image"
+    expected = [
+        (
+            signals.upload_profile_picture,
+            regular_user.pk,
+            regular_user.profile_picture.name,
+            "",
+        )
+    ]
+    assert scheduled == (expected if configured else [])
+
+
+@pytest.mark.django_db
+def test_profile_picture_uploaded_once(regular_user, monkeypatch, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    monkeypatch.setattr(signals, "is_cloudinary_configured", lambda: True)
+    scheduled = []
+    monkeypatch.setattr(
+        signals, "run_in_background", lambda *args: scheduled.append(args)
+    )
+
+    regular_user.profile_picture = SimpleUploadedFile("a.png", b"image")
+    regular_user.save()
+    regular_user.save()
+    regular_user.refresh_from_db()
+    regular_user.save()
+    assert len(scheduled) == 1
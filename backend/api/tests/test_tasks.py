@@ -0,0 +1,60 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models.signals import post_save
+
+from api import tasks
+
+
+@pytest.fixture
+def stored_picture(regular_user, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    name = default_storage.save("profile_pictures/a.png", ContentFile(b"image"))
+    type(regular_user).objects.filter(pk=regular_user.pk).update(profile_picture=name)
+    return name
+
+
+@pytest.mark.django_db
+def test_upload_profile_picture_updates_url_only(
+    regular_user, stored_picture, monkeypatch, django_assert_num_queries
+):
+    url = "https://res.cloudinary.com/demo/image/upload/v1/users/a.png"
+    uploaded = []
+    monkeypatch.setattr(
+        tasks,
+        "upload_to_cloudinary",
+        lambda picture, **kw: uploaded.append(picture.read()) or url,
+    )
+
+    saved = []
+
+    def receiver(sender, **kwargs):
+        saved.append(sender)
+
+    post_save.connect(receiver, dispatch_uid="test_upload_profile_picture")
+    try:
+        with django_assert_num_queries(1):
+            tasks.upload_profile_picture(regular_user.pk, stored_picture)
+    finally:
+        post_save.disconnect(dispatch_uid="test_upload_profile_picture")
+
+    assert saved == []
+    assert uploaded == [b"image"]
+    regular_user.refresh_from_db()
+    assert regular_user.profile_picture_url == url
+    assert not regular_user.profile_picture
+    assert not default_storage.exists(stored_picture)
+
+
+@pytest.mark.django_db
+def test_upload_profile_picture_keeps_file_on_failure(
+    regular_user, stored_picture, monkeypatch
+):
+    monkeypatch.setattr(tasks, "upload_to_cloudinary", lambda *a, **kw: None)
+
+    tasks.upload_profile_picture(regular_user.pk, stored_picture)
+
+    regular_user.refresh_from_db()
+    assert regular_user.profile_picture_url == ""
+    assert regular_user.profile_picture.name == stored_picture
+    assert default_storage.exists(stored_picture)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from unfold.admin import ModelAdmin
 from unfold.decorators import display
@@ -8,43 +9,65 @@ from unfold.widgets import (
     UnfoldAdminTextInputWidget,
 )
 
-from settings_config.services import get_tinymce_config
+from api.pagination import FasterAdminPaginator
+from settings_config.services import get_tinymce_editor_context
 
 from .forms import NewsletterAdminForm, NewsletterSubscriberAdminForm, PostAdminForm
 from .models import Category, Newsletter, NewsletterSubscriber, Post, Tag
 
+# Shared by the admins below. Widgets are given as classes on purpose: Django
+# deep-copies widget instances for every form field, which is slower than
+# instantiating the class. EmailField is covered through CharField.
+TEXT_WIDGET_OVERRIDES = {
+    models.CharField: {"widget": UnfoldAdminTextInputWidget},
+    models.TextField: {"widget": UnfoldAdminTextareaWidget},
+}
+
+
+def _count_subquery(queryset, field):
+    """
+    Count the rows of queryset that point at the outer row through field.
+
+    A correlated subquery is evaluated for the listed page only, instead of
+    joining every related row and grouping the whole table.
+    """
+    counts = (
+        queryset.filter(**{field: models.OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=models.Count("*"))
+        .values("count")
+    )
+    return Coalesce(models.Subquery(counts), 0)
+
 
 @admin.register(Category)
 class CategoryAdmin(ModelAdmin):
     list_display = ["name", "slug", "post_count", "created_at"]
-    search_fields = ["name", "slug"]
+    search_fields = ["name"]
     prepopulated_fields = {"slug": ("name",)}
 
-    formfield_overrides = {
-        models.CharField: {"widget": UnfoldAdminTextInputWidget},
-        models.TextField: {"widget": UnfoldAdminTextareaWidget},
-    }
+    formfield_overrides = TEXT_WIDGET_OVERRIDES
 
-    def post_count(self, obj):
-        return obj.posts.count()
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_post_count=_count_subquery(Post.objects, "category"))
+        )
 
-    post_count.short_description = _("Posts")
+    @display(description=_("Posts"), ordering="_post_count")
+    def post_count(self, obj):
+        return obj._post_count
 
 
 @admin.register(Tag)
 class TagAdmin(ModelAdmin):
     list_display = ["name", "slug", "post_count"]
-    search_fields = ["name", "slug"]
+    search_fields = ["name"]
     prepopulated_fields = {"slug": ("name",)}
 
-    formfield_overrides = {
-        models.CharField: {"widget": UnfoldAdminTextInputWidget},
-    }
-
-    def post_count(self, obj):
-        return obj.posts.count()
-
-    post_count.short_description = _("Posts")
+    formfield_overrides = TEXT_WIDGET_OVERRIDES
 
 
 @admin.register(Post)
@@ -55,9 +78,10 @@ class PostAdmin(ModelAdmin):
         "display_status",
         "display_featured",
         "author",
-        "category",
+        "display_category",
         "published_at",
     ]
+    list_select_related = ["author"]
     list_filter = [
         "status",
         "is_featured",
@@ -68,6 +92,9 @@ class PostAdmin(ModelAdmin):
     autocomplete_fields = ["author", "category", "tags"]
     readonly_fields = ["created_at", "updated_at"]
     date_hierarchy = "published_at"
+    list_per_page = 25
+    show_full_result_count = False
+    paginator = FasterAdminPaginator
 
     fieldsets = (
         (
@@ -123,7 +150,7 @@ class PostAdmin(ModelAdmin):
         },
     )
     def display_status(self, instance):
-        return instance.status
+        return instance.status, instance.get_status_display()
 
     @display(
         description=_("Featured"),
@@ -135,21 +162,23 @@ class PostAdmin(ModelAdmin):
     def display_featured(self, instance):
         return instance.is_featured
 
-    def change_view(self, request, object_id, form_url="", extra_context=None):
-        extra_context = extra_context or {}
-        tinymce_config = get_tinymce_config()
-        if tinymce_config:
-            extra_context["tinymce_config"] = tinymce_config.get_config_dict()
-            extra_context["tinymce_js_url"] = tinymce_config.get_js_url()
-        return super().change_view(request, object_id, form_url, extra_context)
+    @display(description=_("Category"), ordering="category_name")
+    def display_category(self, instance):
+        # Copied onto the post, so the changelist doesn't join the category
+        return instance.category_name or None
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The changelist never renders the post body, so don't load it there
+        match = request.resolver_match
+        if match and match.url_name == "blog_post_changelist":
+            queryset = queryset.defer("content", "excerpt")
+        return queryset
 
-    def add_view(self, request, form_url="", extra_context=None):
-        extra_context = extra_context or {}
-        tinymce_config = get_tinymce_config()
-        if tinymce_config:
-            extra_context["tinymce_config"] = tinymce_config.get_config_dict()
-            extra_context["tinymce_js_url"] = tinymce_config.get_js_url()
-        return super().add_view(request, form_url, extra_context)
+    def render_change_form(self, request, context, *args, **kwargs):
+        # Shared by the add and change views
+        context.update(get_tinymce_editor_context())
+        return super().render_change_form(request, context, *args, **kwargs)
 
 
 @admin.register(NewsletterSubscriber)
@@ -164,11 +193,11 @@ class NewsletterSubscriberAdmin(ModelAdmin):
         "unsubscribed_at",
         "created_at",
     ]
+    list_per_page = 25
+    show_full_result_count = False
+    paginator = FasterAdminPaginator
 
-    formfield_overrides = {
-        models.CharField: {"widget": UnfoldAdminTextInputWidget},
-        models.EmailField: {"widget": UnfoldAdminTextInputWidget},
-    }
+    formfield_overrides = TEXT_WIDGET_OVERRIDES
 
     fieldsets = (
         (
@@ -201,7 +230,7 @@ class NewsletterSubscriberAdmin(ModelAdmin):
         },
     )
     def display_status(self, instance):
-        return instance.status
+        return instance.status, instance.get_status_display()
 
 
 @admin.register(Newsletter)
@@ -258,4 +287,4 @@ class NewsletterAdmin(ModelAdmin):
         },
     )
     def display_status(self, instance):
-        return instance.status
+        return instance.status, instance.get_status_display()
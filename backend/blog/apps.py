@@ -6,3 +6,6 @@ class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blog"
     verbose_name = _("Blog & Newsletter")
+
+    def ready(self):
+        import blog.signals  # noqa: F401
@@ -7,9 +7,13 @@ from unfold.widgets import (
     UnfoldBooleanSwitchWidget,
 )
 
-from settings_config.services import get_cloudinary_config, upload_to_cloudinary
+from settings_config.services import (
+    is_cloudinary_configured,
+    run_in_background_with_file,
+)
 
 from .models import Newsletter, NewsletterSubscriber, Post
+from .tasks import upload_featured_image
 
 
 class PostAdminForm(forms.ModelForm):
@@ -40,29 +44,20 @@ class PostAdminForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Check if Cloudinary is configured
-        if not get_cloudinary_config():
+        if not is_cloudinary_configured():
             self.fields["featured_image_file"].help_text = _(
                 "Cloudinary is not configured. Please configure it in System Settings."
             )
             self.fields["featured_image_file"].disabled = True
 
-    def save(self, commit=True):
-        instance = super().save(commit=False)
-
-        # Handle Cloudinary upload
-        if self.cleaned_data.get("featured_image_file"):
-            url = upload_to_cloudinary(
-                self.cleaned_data["featured_image_file"],
-                folder="blog/featured",
-            )
-            if url:
-                instance.featured_image_url = url
-
-        if commit:
-            instance.save()
-            self.save_m2m()
+    def _save_m2m(self):
+        super()._save_m2m()
 
-        return instance
+        # Handle Cloudinary upload once the post has been saved. This runs
+        # for both commit=True and the admin's deferred save_m2m() call.
+        image = self.cleaned_data.get("featured_image_file")
+        if image:
+            run_in_background_with_file(upload_featured_image, image, self.instance.pk)
 
 
 class NewsletterAdminForm(forms.ModelForm):
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:11
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("blog", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-published_at"], name="blog_post_status_pub_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["is_featured", "-published_at"],
+                name="blog_post_featured_pub_idx",
+            ),
+        ),
+    ]
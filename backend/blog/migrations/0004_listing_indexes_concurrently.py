@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:18
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("blog", "0003_category_tag_name_trgm"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="newslettersubscriber",
+            index=models.Index(fields=["status"], name="blog_subscriber_status_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["-published_at", "-created_at"], name="blog_post_ordering_idx"
+            ),
+        ),
+    ]
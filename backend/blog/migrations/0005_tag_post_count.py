@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:24
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_post_counts(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    Tag = apps.get_model("blog", "Tag")
+    counts = (
+        Post.tags.through.objects.filter(tag=models.OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(count=models.Count("*"))
+        .values("count")
+    )
+    Tag.objects.update(post_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0004_listing_indexes_concurrently"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="post_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Posts"
+            ),
+        ),
+        migrations.RunPython(populate_post_counts, migrations.RunPython.noop),
+    ]
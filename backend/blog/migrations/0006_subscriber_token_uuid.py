@@ -0,0 +1,54 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:27
+
+import uuid
+
+from django.db import migrations, models
+
+
+def convert_tokens_to_uuid(apps, schema_editor):
+    NewsletterSubscriber = apps.get_model("blog", "NewsletterSubscriber")
+    subscribers = NewsletterSubscriber.objects.exclude(confirmation_token=None)
+    for subscriber in subscribers.only("pk", "confirmation_token").iterator():
+        token = subscriber.confirmation_token.strip()
+        if not token:
+            token = None
+        else:
+            # Tokens that aren't UUIDs can't be kept, issue a new one
+            try:
+                token = str(uuid.UUID(token))
+            except ValueError:
+                token = str(uuid.uuid4())
+        NewsletterSubscriber.objects.filter(pk=subscriber.pk).update(
+            confirmation_token=token
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0005_tag_post_count"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newslettersubscriber",
+            name="confirmation_token",
+            field=models.CharField(
+                blank=True,
+                max_length=100,
+                null=True,
+                verbose_name="Confirmation Token",
+            ),
+        ),
+        migrations.RunPython(convert_tokens_to_uuid, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="newslettersubscriber",
+            name="confirmation_token",
+            field=models.UUIDField(
+                blank=True,
+                default=uuid.uuid4,
+                null=True,
+                unique=True,
+                verbose_name="Confirmation Token",
+            ),
+        ),
+    ]
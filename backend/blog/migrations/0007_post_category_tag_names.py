@@ -0,0 +1,51 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:28
+
+import django.contrib.postgres.fields
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_names(apps, schema_editor):
+    Category = apps.get_model("blog", "Category")
+    Post = apps.get_model("blog", "Post")
+    Tag = apps.get_model("blog", "Tag")
+    category_names = Category.objects.filter(pk=models.OuterRef("category")).values(
+        "name"
+    )
+    tag_names = (
+        Tag.objects.filter(posts=models.OuterRef("pk")).order_by("name").values("name")
+    )
+    Post.objects.update(
+        category_name=Coalesce(models.Subquery(category_names), models.Value("")),
+        tag_names=ArraySubquery(tag_names),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0006_subscriber_token_uuid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="category_name",
+            field=models.CharField(
+                blank=True, editable=False, max_length=100, verbose_name="Category name"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="tag_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=50),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+                verbose_name="Tag names",
+            ),
+        ),
+        migrations.RunPython(populate_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:30
+
+from django.db import migrations, models
+
+STATUSES = {
+    "Post": ["draft", "published", "archived"],
+    "NewsletterSubscriber": ["pending", "active", "unsubscribed"],
+    "Newsletter": ["draft", "scheduled", "sent"],
+}
+
+
+def statuses_to_numbers(apps, schema_editor):
+    # Store the numbers as text so the column can then be cast to smallint
+    for model_name, statuses in STATUSES.items():
+        model = apps.get_model("blog", model_name)
+        for number, status in enumerate(statuses):
+            model.objects.filter(status=status).update(status=str(number))
+
+
+def numbers_to_statuses(apps, schema_editor):
+    for model_name, statuses in STATUSES.items():
+        model = apps.get_model("blog", model_name)
+        for number, status in enumerate(statuses):
+            model.objects.filter(status=str(number)).update(status=status)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0007_post_category_tag_names"),
+    ]
+
+    operations = [
+        migrations.RunPython(statuses_to_numbers, numbers_to_statuses),
+        migrations.AlterField(
+            model_name="newsletter",
+            name="status",
+            field=models.SmallIntegerField(
+                choices=[(0, "Draft"), (1, "Scheduled"), (2, "Sent")],
+                default=0,
+                verbose_name="Status",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="newslettersubscriber",
+            name="status",
+            field=models.SmallIntegerField(
+                choices=[
+                    (0, "Pending Confirmation"),
+                    (1, "Active"),
+                    (2, "Unsubscribed"),
+                ],
+                default=0,
+                verbose_name="Status",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="post",
+            name="status",
+            field=models.SmallIntegerField(
+                choices=[(0, "Draft"), (1, "Published"), (2, "Archived")],
+                default=0,
+                verbose_name="Status",
+            ),
+        ),
+    ]
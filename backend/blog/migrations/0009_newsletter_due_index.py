@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:34
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("blog", "0008_integer_statuses"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="newsletter",
+            index=models.Index(
+                condition=models.Q(("status", 1)),
+                fields=["scheduled_at"],
+                name="blog_newsletter_due_idx",
+            ),
+        ),
+    ]
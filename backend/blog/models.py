@@ -1,11 +1,46 @@
+import uuid
+
 from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Coalesce, Upper
 from django.utils import timezone
-from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from .utils import fast_slugify
+
+
+class AutoSlugMixin:
+    """Fill in an empty slug from the slug_source field when saving."""
+
+    slug_source = "name"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        # Check update_fields first so a deferred slug isn't loaded for nothing
+        if (update_fields is None or "slug" in update_fields) and not self.slug:
+            self.slug = fast_slugify(getattr(self, self.slug_source))
+        super().save(*args, **kwargs)
+
+
+class NameTrackingMixin:
+    """Remember the name loaded from the database to detect renames."""
 
-class Category(models.Model):
+    _loaded_name = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_name = instance.__dict__.get("name")
+        return instance
+
+    def name_changed(self):
+        return self.name != self._loaded_name
+
+
+class Category(NameTrackingMixin, AutoSlugMixin, models.Model):
     """Blog post categories."""
 
     name = models.CharField(_("Name"), max_length=100)
@@ -17,43 +52,82 @@ class Category(models.Model):
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
         ordering = ["name"]
+        indexes = [
+            # Admin search and autocomplete run UPPER(name) LIKE UPPER(...)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="blog_category_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
 
-
-class Tag(models.Model):
+class Tag(NameTrackingMixin, AutoSlugMixin, models.Model):
     """Blog post tags."""
 
     name = models.CharField(_("Name"), max_length=50)
     slug = models.SlugField(_("Slug"), max_length=50, unique=True, blank=True)
+    # Kept up to date by the signals in blog.signals
+    post_count = models.PositiveIntegerField(_("Posts"), default=0, editable=False)
 
     class Meta:
         verbose_name = _("Tag")
         verbose_name_plural = _("Tags")
         ordering = ["name"]
+        indexes = [
+            # Admin search and autocomplete run UPPER(name) LIKE UPPER(...)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="blog_tag_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
-
-class Post(models.Model):
+    @classmethod
+    def update_post_counts(cls, tag_ids):
+        """Recount the posts of the given tags in a single UPDATE."""
+        if not tag_ids:
+            return
+        counts = (
+            Post.tags.through.objects.filter(tag=models.OuterRef("pk"))
+            .order_by()
+            .values("tag")
+            .annotate(count=models.Count("*"))
+            .values("count")
+        )
+        cls.objects.filter(pk__in=tag_ids).update(
+            post_count=Coalesce(models.Subquery(counts), 0)
+        )
+
+
+class PostQuerySet(models.QuerySet):
+    def with_relations(self):
+        """Load the author, category and tags along with the posts."""
+        return self.select_related("author", "category").prefetch_related("tags")
+
+
+class PublishedPostManager(models.Manager.from_queryset(PostQuerySet)):
+    """Posts that are published and visible now."""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .filter(status=Post.Status.PUBLISHED, published_at__lte=timezone.now())
+        )
+
+
+class Post(AutoSlugMixin, models.Model):
     """Blog posts."""
 
-    class Status(models.TextChoices):
-        DRAFT = "draft", _("Draft")
-        PUBLISHED = "published", _("Published")
-        ARCHIVED = "archived", _("Archived")
+    class Status(models.IntegerChoices):
+        DRAFT = 0, _("Draft")
+        PUBLISHED = 1, _("Published")
+        ARCHIVED = 2, _("Archived")
 
     title = models.CharField(_("Title"), max_length=255)
     slug = models.SlugField(_("Slug"), max_length=255, unique=True, blank=True)
@@ -89,9 +163,20 @@ class Post(models.Model):
         related_name="posts",
         verbose_name=_("Tags"),
     )
-    status = models.CharField(
+    # Copies of the category and tag names for listings, so they can be
+    # rendered without joins. Kept up to date by save() and blog.signals.
+    category_name = models.CharField(
+        _("Category name"), max_length=100, blank=True, editable=False
+    )
+    tag_names = ArrayField(
+        models.CharField(max_length=50),
+        verbose_name=_("Tag names"),
+        default=list,
+        blank=True,
+        editable=False,
+    )
+    status = models.SmallIntegerField(
         _("Status"),
-        max_length=20,
         choices=Status.choices,
         default=Status.DRAFT,
     )
@@ -118,42 +203,77 @@ class Post(models.Model):
         help_text=_("SEO description (max 160 chars)"),
     )
 
+    objects = PostQuerySet.as_manager()
+    published = PublishedPostManager()
+
+    slug_source = "title"
+
     class Meta:
         verbose_name = _("Post")
         verbose_name_plural = _("Posts")
         ordering = ["-published_at", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-published_at", "-created_at"], name="blog_post_ordering_idx"
+            ),
+            models.Index(
+                fields=["status", "-published_at"], name="blog_post_status_pub_idx"
+            ),
+            models.Index(
+                fields=["is_featured", "-published_at"],
+                name="blog_post_featured_pub_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "category" in update_fields:
+            self.category_name = self.category.name if self.category else ""
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "category_name"}
         # Auto-set published_at when status changes to published
         if self.status == self.Status.PUBLISHED and not self.published_at:
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def update_tag_names(cls, post_ids):
+        """
+        Refresh tag_names of the given posts in a single UPDATE.
+
+        post_ids may also be a queryset of post pks, run as a subquery.
+        """
+        if post_ids is None:
+            return
+        names = Tag.objects.filter(posts=models.OuterRef("pk")).values("name")
+        cls.objects.filter(pk__in=post_ids).update(
+            tag_names=ArraySubquery(names.order_by("name"))
+        )
+
 
 class NewsletterSubscriber(models.Model):
     """Newsletter subscribers."""
 
-    class Status(models.TextChoices):
-        PENDING = "pending", _("Pending Confirmation")
-        ACTIVE = "active", _("Active")
-        UNSUBSCRIBED = "unsubscribed", _("Unsubscribed")
+    class Status(models.IntegerChoices):
+        PENDING = 0, _("Pending Confirmation")
+        ACTIVE = 1, _("Active")
+        UNSUBSCRIBED = 2, _("Unsubscribed")
 
     email = models.EmailField(_("Email"), unique=True)
     name = models.CharField(_("Name"), max_length=100, blank=True)
-    status = models.CharField(
+    status = models.SmallIntegerField(
         _("Status"),
-        max_length=20,
         choices=Status.choices,
         default=Status.PENDING,
     )
-    confirmation_token = models.CharField(
+    confirmation_token = models.UUIDField(
         _("Confirmation Token"),
-        max_length=100,
+        default=uuid.uuid4,
+        unique=True,
+        null=True,
         blank=True,
     )
     confirmed_at = models.DateTimeField(_("Confirmed at"), null=True, blank=True)
@@ -164,24 +284,53 @@ class NewsletterSubscriber(models.Model):
         verbose_name = _("Newsletter Subscriber")
         verbose_name_plural = _("Newsletter Subscribers")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status"], name="blog_subscriber_status_idx"),
+        ]
 
     def __str__(self):
         return self.email
 
+    @classmethod
+    def bulk_subscribe(cls, emails, batch_size=1000):
+        """
+        Create pending subscribers for the given emails in batched INSERTs.
+
+        Emails that are already subscribed are skipped. Since conflicting rows
+        are not returned by the database, the created instances have no pk.
+        """
+        subscribers = [cls(email=email) for email in emails]
+        return cls.objects.bulk_create(
+            subscribers, batch_size=batch_size, ignore_conflicts=True
+        )
+
+
+class NewsletterQuerySet(models.QuerySet):
+    def due(self):
+        """
+        Scheduled newsletters whose send time has passed.
+
+        When several workers poll, lock the rows with
+        select_for_update(skip_locked=True) inside a transaction so each
+        newsletter is only picked up once.
+        """
+        return self.filter(
+            status=Newsletter.Status.SCHEDULED, scheduled_at__lte=timezone.now()
+        )
+
 
 class Newsletter(models.Model):
     """Newsletter campaigns."""
 
-    class Status(models.TextChoices):
-        DRAFT = "draft", _("Draft")
-        SCHEDULED = "scheduled", _("Scheduled")
-        SENT = "sent", _("Sent")
+    class Status(models.IntegerChoices):
+        DRAFT = 0, _("Draft")
+        SCHEDULED = 1, _("Scheduled")
+        SENT = 2, _("Sent")
 
     subject = models.CharField(_("Subject"), max_length=255)
     content = models.TextField(_("Content"), blank=True)
-    status = models.CharField(
+    status = models.SmallIntegerField(
         _("Status"),
-        max_length=20,
         choices=Status.choices,
         default=Status.DRAFT,
     )
@@ -191,10 +340,20 @@ class Newsletter(models.Model):
     created_at = models.DateTimeField(_("Created"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated"), auto_now=True)
 
+    objects = NewsletterQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Newsletter")
         verbose_name_plural = _("Newsletters")
         ordering = ["-created_at"]
+        indexes = [
+            # Only pending newsletters are indexed, see NewsletterQuerySet.due()
+            models.Index(
+                fields=["scheduled_at"],
+                name="blog_newsletter_due_idx",
+                condition=models.Q(status=1),  # Status.SCHEDULED
+            ),
+        ]
 
     def __str__(self):
         return self.subject
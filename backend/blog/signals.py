@@ -0,0 +1,89 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Category, Post, Tag
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_tag_post_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep Tag.post_count in sync when posts and tags are linked or unlinked.
+    """
+    if action == "pre_clear":
+        # The cleared rows are gone by post_clear, remember the affected tags
+        if reverse:
+            instance._cleared_tag_ids = [instance.pk]
+        else:
+            instance._cleared_tag_ids = list(instance.tags.values_list("pk", flat=True))
+    elif action == "post_clear":
+        Tag.update_post_counts(instance.__dict__.pop("_cleared_tag_ids", None))
+    elif action in ("post_add", "post_remove"):
+        Tag.update_post_counts([instance.pk] if reverse else pk_set)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post_tags(sender, instance, **kwargs):
+    instance._deleted_tag_ids = list(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Post)
+def update_deleted_post_tag_counts(sender, instance, **kwargs):
+    """
+    Deleting a post removes its tag links without sending m2m_changed.
+    """
+    Tag.update_post_counts(instance.__dict__.pop("_deleted_tag_ids", None))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_post_tag_names(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep Post.tag_names in sync when posts and tags are linked or unlinked.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_post_ids = list(instance.posts.values_list("pk", flat=True))
+    elif action == "post_clear":
+        if reverse:
+            Post.update_tag_names(instance.__dict__.pop("_cleared_post_ids", None))
+        else:
+            Post.update_tag_names([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        Post.update_tag_names(pk_set if reverse else [instance.pk])
+
+
+@receiver(post_save, sender=Tag)
+def update_renamed_tag_names(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "name" not in update_fields:
+        return
+    if not created and instance.name_changed():
+        Post.update_tag_names(instance.posts.values("pk"))
+    instance._loaded_name = instance.name
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_deleted_tag_posts(sender, instance, **kwargs):
+    instance._deleted_post_ids = list(instance.posts.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def update_deleted_tag_names(sender, instance, **kwargs):
+    """
+    Deleting a tag removes its post links without sending m2m_changed.
+    """
+    Post.update_tag_names(instance.__dict__.pop("_deleted_post_ids", None))
+
+
+@receiver(post_save, sender=Category)
+def update_category_names(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "name" not in update_fields:
+        return
+    if not created and instance.name_changed():
+        Post.objects.filter(category=instance).update(category_name=instance.name)
+    instance._loaded_name = instance.name
+
+
+@receiver(post_delete, sender=Category)
+def clear_deleted_category_names(sender, instance, **kwargs):
+    # The posts' category has already been set to NULL by the delete
+    Post.objects.filter(category=None).exclude(category_name="").update(
+        category_name=""
+    )
@@ -0,0 +1,12 @@
+from settings_config.services import upload_to_cloudinary
+
+from .models import Post
+
+
+def upload_featured_image(path, post_id):
+    """
+    Upload a featured image to Cloudinary and store its URL on the post.
+    """
+    url = upload_to_cloudinary(path, folder="blog/featured")
+    if url:
+        Post.objects.filter(pk=post_id).update(featured_image_url=url)
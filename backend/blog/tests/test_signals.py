@@ -0,0 +1,137 @@
+import pytest
+
+from blog.models import Category, Post, Tag
+
+
+def post_counts():
+    return dict(Tag.objects.values_list("name", "post_count"))
+
+
+def tag_names(post):
+    return Post.objects.values_list("tag_names", flat=True).get(pk=post.pk)
+
+
+def category_name(post):
+    return Post.objects.values_list("category_name", flat=True).get(pk=post.pk)
+
+
+@pytest.fixture
+def tags():
+    return [Tag.objects.create(name=name) for name in ("b", "a", "c")]
+
+
+@pytest.fixture
+def post():
+    return Post.objects.create(title="Post")
+
+
+@pytest.mark.django_db
+def test_add_remove_clear_from_post(post, tags):
+    b, a, c = tags
+    post.tags.add(b, a)
+    assert post_counts() == {"a": 1, "b": 1, "c": 0}
+    assert tag_names(post) == ["a", "b"]
+
+    post.tags.remove(a)
+    assert post_counts() == {"a": 0, "b": 1, "c": 0}
+    assert tag_names(post) == ["b"]
+
+    post.tags.set([a, c])
+    assert post_counts() == {"a": 1, "b": 0, "c": 1}
+    assert tag_names(post) == ["a", "c"]
+
+    post.tags.clear()
+    assert post_counts() == {"a": 0, "b": 0, "c": 0}
+    assert tag_names(post) == []
+
+
+@pytest.mark.django_db
+def test_add_remove_clear_from_tag(post, tags):
+    b, a, c = tags
+    other = Post.objects.create(title="Other")
+    a.posts.add(post, other)
+    b.posts.add(post)
+    assert post_counts() == {"a": 2, "b": 1, "c": 0}
+    assert tag_names(post) == ["a", "b"]
+    assert tag_names(other) == ["a"]
+
+    a.posts.remove(other)
+    assert post_counts() == {"a": 1, "b": 1, "c": 0}
+    assert tag_names(other) == []
+
+    a.posts.add(other)
+    a.posts.clear()
+    assert post_counts() == {"a": 0, "b": 1, "c": 0}
+    assert tag_names(post) == ["b"]
+    assert tag_names(other) == []
+
+
+@pytest.mark.django_db
+def test_tag_rename(post, tags):
+    b, a, c = tags
+    post.tags.add(a, b)
+    a.name = "d"
+    a.save()
+    assert tag_names(post) == ["b", "d"]
+
+
+@pytest.mark.django_db
+def test_category_rename(post):
+    category = Category.objects.create(name="News")
+    post.category = category
+    post.save()
+    assert category_name(post) == "News"
+
+    category.name = "Updates"
+    category.save()
+    assert category_name(post) == "Updates"
+
+
+@pytest.mark.django_db
+def test_save_without_rename_skips_posts(post, tags, django_assert_num_queries):
+    post.tags.add(*tags)
+    category = Category.objects.create(name="News")
+    post.category = category
+    post.save()
+
+    for instance in (
+        category,
+        Category.objects.get(),
+        tags[0],
+        Tag.objects.get(name="a"),
+    ):
+        instance.slug = f"{instance.slug}-2"
+        with django_assert_num_queries(1):
+            instance.save()
+
+
+@pytest.mark.django_db
+def test_deletes(post, tags):
+    b, a, c = tags
+    other = Post.objects.create(title="Other")
+    post.tags.add(a, b)
+    other.tags.add(a)
+
+    b.delete()
+    assert tag_names(post) == ["a"]
+
+    other.delete()
+    assert post_counts() == {"a": 1, "c": 0}
+
+    category = Category.objects.create(name="News")
+    post.category = category
+    post.save()
+    category.delete()
+    assert category_name(post) == ""
+
+
+@pytest.mark.django_db
+def test_save_category_update_fields(post):
+    category = Category.objects.create(name="News")
+    post.category = category
+    post.save(update_fields=["category"])
+    assert category_name(post) == "News"
+
+    post.category = None
+    post.save(update_fields=["category"])
+    assert category_name(post) == ""
@@ -0,0 +1,20 @@
+import pytest
+from django.utils.text import slugify
+
+from blog.utils import fast_slugify
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Hello World",
+        "  Django & Python: Tips_and Tricks!  ",
+        "multiple---dashes and\ttabs\nnewlines",
+        "Café déjà vu",
+        "Ærøskøbing straße",
+        "日本語 title",
+        "",
+    ],
+)
+def test_fast_slugify_matches_django(value):
+    assert fast_slugify(value) == slugify(value)
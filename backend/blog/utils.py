@@ -0,0 +1,22 @@
+import re
+import unicodedata
+
+# Same patterns as django.utils.text.slugify, compiled once
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_HYPHENATE_RE = re.compile(r"[-\s]+")
+
+
+def fast_slugify(value):
+    """
+    Convert a string to a slug, giving the same result as Django's slugify.
+
+    ASCII input, the usual case for titles and names, skips the Unicode
+    normalization and ASCII re-encoding steps entirely.
+    """
+    value = str(value)
+    if not value.isascii():
+        if not unicodedata.is_normalized("NFKD", value):
+            value = unicodedata.normalize("NFKD", value)
+        value = value.encode("ascii", "ignore").decode("ascii")
+    value = _SLUG_STRIP_RE.sub("", value.lower())
+    return _SLUG_HYPHENATE_RE.sub("-", value).strip("-_")
@@ -36,13 +36,14 @@ class SingletonModelAdmin(ModelAdmin):
     }
 
     def has_add_permission(self, request):
-        return not self.model.objects.exists()
+        # The instance is created on demand by load()
+        return False
 
     def has_delete_permission(self, request, obj=None):
         return False
 
     def changelist_view(self, request, extra_context=None):
-        obj, _ = self.model.objects.get_or_create(pk=1)
+        obj = self.model.load()
         return HttpResponseRedirect(
             reverse(
                 f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_change",
@@ -6,3 +6,6 @@ class SettingsConfigConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "settings_config"
     verbose_name = _("System Settings")
+
+    def ready(self):
+        import settings_config.signals  # noqa: F401
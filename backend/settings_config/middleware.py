@@ -0,0 +1,30 @@
+from .models import (
+    CloudinaryConfiguration,
+    ResendConfiguration,
+    StripeConfiguration,
+    TinyMCEConfiguration,
+    preload_singletons,
+)
+
+SINGLETON_MODELS = (
+    StripeConfiguration,
+    ResendConfiguration,
+    TinyMCEConfiguration,
+    CloudinaryConfiguration,
+)
+
+
+class SingletonPreloadMiddleware:
+    """
+    Refresh all configuration singletons with a single cache read per request.
+
+    Without it each singleton's load() goes to the cache on its own once its
+    process-local copy has expired.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        preload_singletons(SINGLETON_MODELS)
+        return self.get_response(request)
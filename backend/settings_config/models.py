@@ -1,7 +1,53 @@
+import time
+from types import MappingProxyType
+
+import cloudinary
 from django.core.cache import cache
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import DEFERRED
 from django.utils.translation import gettext_lazy as _
 
+# Seconds a process reuses singleton data before asking the shared cache again
+LOCAL_CACHE_TTL = 5
+
+# Process-local copies of the cached singleton data: {cache_key: (time, data)}
+_local_cache = {}
+
+# TinyMCE settings that are not configurable, shared by every editor config
+_TINYMCE_STATIC_CONFIG = MappingProxyType(
+    {
+        "content_css": "default",
+        "relative_urls": False,
+        "remove_script_host": False,
+        "convert_urls": True,
+        "branding": False,
+        "promotion": False,
+        "referrer_policy": "origin",
+    }
+)
+
+
+def preload_singletons(singleton_models):
+    """
+    Refresh the process-local copies of several singletons with one cache read.
+
+    Singletons that are not in the shared cache yet are left for load().
+    """
+    now = time.monotonic()
+    keys = []
+    for model in singleton_models:
+        cache_key = f"{model.__name__}_singleton"
+        entry = _local_cache.get(cache_key)
+        if entry is None or now - entry[0] >= LOCAL_CACHE_TTL:
+            keys.append(cache_key)
+    if not keys:
+        return
+    found = cache.get_many(keys)
+    for cache_key in keys:
+        # Misses are stored as None so they aren't asked for again until the
+        # TTL runs out, load() still fetches them itself when they're needed
+        _local_cache[cache_key] = (now, found.get(cache_key))
+
 
 class SingletonModel(models.Model):
     """Base model that ensures only one instance exists."""
@@ -19,18 +65,53 @@ class SingletonModel(models.Model):
         super().delete(*args, **kwargs)
 
     @classmethod
-    def load(cls):
-        """Load the singleton instance, creating it if it doesn't exist."""
+    def load(cls, use_local_cache=True):
+        """
+        Load the singleton instance, creating it if it doesn't exist.
+
+        Pass use_local_cache=False when the result is stored in a shared cache,
+        so a copy that another process has already replaced is not stored again.
+        """
         cache_key = f"{cls.__name__}_singleton"
-        instance = cache.get(cache_key)
-        if instance is None:
-            instance, _ = cls.objects.get_or_create(pk=1)
-            cache.set(cache_key, instance, timeout=300)  # Cache for 5 minutes
-        return instance
+        now = time.monotonic()
+        entry = _local_cache.get(cache_key)
+        if (
+            use_local_cache
+            and entry is not None
+            and entry[1] is not None
+            and now - entry[0] < LOCAL_CACHE_TTL
+        ):
+            data = entry[1]
+        else:
+            # Field values are cached rather than the pickled model instance
+            data = cache.get(cache_key)
+            if data is None:
+                instance, _ = cls.objects.get_or_create(pk=1)
+                data = {
+                    field.attname: getattr(instance, field.attname)
+                    for field in cls._meta.concrete_fields
+                }
+                cache.set(cache_key, data, timeout=300)  # Cache for 5 minutes
+                _local_cache[cache_key] = (now, data)
+                return instance
+            _local_cache[cache_key] = (now, data)
+        # Build a fresh instance so callers never share one. Values are matched
+        # by name, so data cached before a field was added or removed can't
+        # end up in the wrong field. Missing fields are loaded on access.
+        fields = cls._meta.concrete_fields
+        return cls.from_db(
+            router.db_for_read(cls),
+            [field.attname for field in fields],
+            [data.get(field.attname, DEFERRED) for field in fields],
+        )
 
     def clear_cache(self):
         cache_key = f"{self.__class__.__name__}_singleton"
+        # Other processes pick up the change within LOCAL_CACHE_TTL
+        _local_cache.pop(cache_key, None)
         cache.delete(cache_key)
+        # Another process may cache the old row before the change is committed
+        transaction.on_commit(lambda: cache.delete(cache_key))
 
 
 class StripeConfiguration(SingletonModel):
@@ -131,6 +212,13 @@ class ResendConfiguration(SingletonModel):
         status = "Active" if self.is_active else "Inactive"
         return f"Resend Configuration ({status})"
 
+    @property
+    def from_address(self):
+        """Return the sender address, with the name if one is set."""
+        if self.from_name:
+            return f"{self.from_name} <{self.from_email}>"
+        return self.from_email
+
 
 class TinyMCEConfiguration(SingletonModel):
     """TinyMCE rich text editor configuration settings."""
@@ -185,13 +273,7 @@ class TinyMCEConfiguration(SingletonModel):
             "menubar": self.menubar,
             "plugins": self.plugins.split(),
             "toolbar": self.toolbar,
-            "content_css": "default",
-            "relative_urls": False,
-            "remove_script_host": False,
-            "convert_urls": True,
-            "branding": False,
-            "promotion": False,
-            "referrer_policy": "origin",
+            **_TINYMCE_STATIC_CONFIG,
         }
 
     def get_js_url(self):
@@ -241,6 +323,9 @@ class CloudinaryConfiguration(SingletonModel):
     created_at = models.DateTimeField(_("Created"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated"), auto_now=True)
 
+    # Credentials last passed to cloudinary.config() in this process
+    _configured_credentials = None
+
     class Meta:
         verbose_name = _("Cloudinary Configuration")
         verbose_name_plural = _("Cloudinary Configuration")
@@ -251,11 +336,14 @@ class CloudinaryConfiguration(SingletonModel):
 
     def configure(self):
         """Configure the cloudinary library with these settings."""
-        import cloudinary
-
+        credentials = (self.cloud_name, self.api_key, self.api_secret)
+        # The library config is process-wide, only update it when it changed
+        if CloudinaryConfiguration._configured_credentials == credentials:
+            return
         cloudinary.config(
             cloud_name=self.cloud_name,
             api_key=self.api_key,
             api_secret=self.api_secret,
             secure=True,
         )
+        CloudinaryConfiguration._configured_credentials = credentials
@@ -5,12 +5,222 @@ These functions provide a clean interface to retrieve configurations
 and interact with third-party services.
 """
 
+import functools
 import logging
-
+import os
+import re
+import tempfile
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+
+import cloudinary.api
+import cloudinary.uploader
 import requests
+from django.core.cache import cache
+from django.db import connections, transaction
 from django.utils.translation import gettext_lazy as _
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import (
+    CloudinaryConfiguration,
+    ResendConfiguration,
+    StripeConfiguration,
+    TinyMCEConfiguration,
+)
 
 logger = logging.getLogger(__name__)
+# Call durations of the third-party API functions, enable at DEBUG level
+timing_logger = logging.getLogger(f"{__name__}.timing")
+
+TINYMCE_EDITOR_CACHE_KEY = "settings_config:tinymce_editor"
+CLOUDINARY_CONFIGURED_CACHE_KEY = "settings_config:cloudinary_configured"
+
+# Most emails Resend accepts in one batch request
+RESEND_BATCH_SIZE = 100
+
+# Catches obviously malformed recipients before calling the API
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Files above this size are sent to Cloudinary in chunks
+CLOUDINARY_LARGE_UPLOAD_SIZE = 10 * 1024 * 1024
+CLOUDINARY_UPLOAD_CHUNK_SIZE = 6_000_000
+
+# Applied to uploads when auto_optimize is on, before any caller transformation
+CLOUDINARY_AUTO_OPTIMIZE = MappingProxyType(
+    {"quality": "auto:good", "fetch_format": "auto"}
+)
+
+# Most public ids the Admin API deletes in one request
+CLOUDINARY_DELETE_BATCH_SIZE = 100
+
+# Captures the public_id of a delivery URL, without version and extension
+_CLOUDINARY_URL_RE = re.compile(
+    r"^https?://[^/]*cloudinary\.com/[^/]+/[^/]+/upload/(?:v\d+/)?(.+?)(?:\.[^./]+)?$"
+)
+
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+RESEND_HEADERS = {"Content-Type": "application/json"}
+
+# Messages returned by the email functions
+_API_KEY_MISSING = _("API key is not configured.")
+_FROM_EMAIL_MISSING = _("From email is not configured.")
+_TEST_EMAIL_SENT = _("Test email sent successfully to %(email)s")
+_SEND_FAILED = _("Failed to send email: %(error)s")
+_TIMED_OUT = _("Request timed out. Please try again.")
+_EMAIL_NOT_CONFIGURED = _("Email service is not configured.")
+_EMAIL_SENT = _("Email sent successfully.")
+_INVALID_RECIPIENT = _("Invalid recipient email address.")
+
+TEST_EMAIL_SUBJECT = "Test Email - Turbo Configuration"
+TEST_EMAIL_HTML = """
+    <h1>Test Email Successful!</h1>
+    <p>Your Resend email configuration is working correctly.</p>
+    <p>This email was sent from Turbo Admin settings.</p>
+"""
+
+# (connect, read) timeouts in seconds
+RESEND_TIMEOUT = (3, 10)
+# Longest Retry-After in seconds that is waited for before retrying
+RESEND_MAX_RETRY_AFTER = 5
+
+
+class _ResendRetry(Retry):
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RESEND_MAX_RETRY_AFTER)
+
+
+# Shared by all Resend calls so connections (and TLS sessions) are kept alive.
+# POSTs are retried too, which is safe since every request carries an
+# Idempotency-Key that Resend uses to drop duplicates. Read errors are not
+# retried, so a read timeout reaches the caller as requests' Timeout after
+# one RESEND_TIMEOUT instead of after every retry.
+_resend_session = requests.Session()
+_resend_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=_ResendRetry(
+            total=3,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            # Return the last response so its error message can be reported
+            raise_on_status=False,
+        ),
+    ),
+)
+
+_background_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="settings_config"
+)
+# Separate pool so slow email sends don't hold up other background tasks
+_email_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="email")
+
+
+def _timed(name):
+    """
+    Log how long each call of the decorated function takes, and its outcome.
+
+    The outcome is "success" or "failure" from the returned value (the first
+    item of a (success, message) tuple), or "error" if the call raised.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not timing_logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                success = result[0] if isinstance(result, tuple) else result
+                outcome = "success" if success else "failure"
+                return result
+            finally:
+                timing_logger.debug(
+                    "%s %s in %.1f ms",
+                    name,
+                    outcome,
+                    (time.perf_counter() - start) * 1000,
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _run_task(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", func.__name__)
+    finally:
+        # Worker threads open their own database connections
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run a function in a background thread once the current transaction commits.
+
+    Use this to keep slow third-party calls (e.g. Cloudinary uploads) off the
+    request path. Arguments must not reference request-scoped objects such as
+    uploaded files, use run_in_background_with_file() for those.
+
+    Usage:
+        from settings_config.services import run_in_background
+        run_in_background(delete_from_cloudinary, old_url)
+    """
+    transaction.on_commit(
+        lambda: _background_executor.submit(_run_task, func, *args, **kwargs)
+    )
+
+
+def _copy_to_temporary_file(file):
+    suffix = os.path.splitext(file.name or "")[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temporary_file:
+        for chunk in file.chunks():
+            temporary_file.write(chunk)
+    return temporary_file.name
+
+
+def _run_file_task(func, path, *args, **kwargs):
+    try:
+        _run_task(func, path, *args, **kwargs)
+    finally:
+        os.remove(path)
+
+
+def run_in_background_with_file(func, file, *args, **kwargs):
+    """
+    Run a function on a copy of a file in a background thread.
+
+    Once the current transaction commits, while the request still holds the
+    file, it is copied chunk by chunk to a temporary file on disk. func is
+    then called in a background thread with the path of that copy as first
+    argument, followed by args and kwargs. The copy is removed afterwards.
+
+    Usage:
+        from settings_config.services import run_in_background_with_file
+        run_in_background_with_file(upload_featured_image, image, post.pk)
+    """
+
+    def copy_and_submit():
+        path = _copy_to_temporary_file(file)
+        _background_executor.submit(_run_file_task, func, path, *args, **kwargs)
+
+    transaction.on_commit(copy_and_submit)
 
 
 def get_stripe_config():
@@ -26,8 +236,6 @@ def get_stripe_config():
         if config:
             stripe.api_key = config.secret_key
     """
-    from .models import StripeConfiguration
-
     config = StripeConfiguration.load()
     if config.is_active and config.secret_key:
         return config
@@ -47,14 +255,38 @@ def get_resend_config():
         if config:
             resend.api_key = config.api_key
     """
-    from .models import ResendConfiguration
-
     config = ResendConfiguration.load()
     if config.is_active and config.api_key:
         return config
     return None
 
 
+def _resend_headers(config):
+    return {
+        **RESEND_HEADERS,
+        "Authorization": f"Bearer {config.api_key}",
+        # Retries of this request reuse the key, so it is only sent once
+        "Idempotency-Key": str(uuid.uuid4()),
+    }
+
+
+def _resend_succeeded(response):
+    # response.ok is also true for redirects, which Resend doesn't send on success
+    return 200 <= response.status_code < 300
+
+
+def _resend_error_message(response):
+    # Error pages from proxies or outages are not always JSON
+    try:
+        error_data = response.json()
+    except ValueError:
+        return response.text
+    if isinstance(error_data, dict) and error_data.get("message"):
+        return error_data["message"]
+    return response.text
+
+
+@_timed("resend.send_test_email")
 def send_test_email(config, to_email: str) -> tuple[bool, str]:
     """
     Send a test email using Resend API.
@@ -67,52 +299,39 @@ def send_test_email(config, to_email: str) -> tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     if not config.api_key:
-        return False, _("API key is not configured.")
+        return False, _API_KEY_MISSING
 
     if not config.from_email:
-        return False, _("From email is not configured.")
+        return False, _FROM_EMAIL_MISSING
 
     try:
-        response = requests.post(
-            "https://api.resend.com/emails",
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "Content-Type": "application/json",
-            },
+        response = _resend_session.post(
+            RESEND_EMAILS_URL,
+            headers=_resend_headers(config),
             json={
-                "from": f"{config.from_name} <{config.from_email}>"
-                if config.from_name
-                else config.from_email,
+                "from": config.from_address,
                 "to": [to_email],
-                "subject": "Test Email - Turbo Configuration",
-                "html": """
-                    <h1>Test Email Successful!</h1>
-                    <p>Your Resend email configuration is working correctly.</p>
-                    <p>This email was sent from Turbo Admin settings.</p>
-                """,
+                "subject": TEST_EMAIL_SUBJECT,
+                "html": TEST_EMAIL_HTML,
             },
-            timeout=10,
+            timeout=RESEND_TIMEOUT,
         )
 
-        if response.status_code == 200:
-            return True, _("Test email sent successfully to %(email)s") % {
-                "email": to_email
-            }
+        if _resend_succeeded(response):
+            return True, _TEST_EMAIL_SENT % {"email": to_email}
         else:
-            error_data = response.json()
-            error_message = error_data.get("message", response.text)
-            logger.error(f"Resend API error: {error_message}")
-            return False, _("Failed to send email: %(error)s") % {
-                "error": error_message
-            }
+            error_message = _resend_error_message(response)
+            logger.error("Resend API error: %s", error_message)
+            return False, _SEND_FAILED % {"error": error_message}
 
     except requests.exceptions.Timeout:
-        return False, _("Request timed out. Please try again.")
+        return False, _TIMED_OUT
     except requests.exceptions.RequestException as e:
         logger.exception("Error sending test email")
-        return False, _("Failed to send email: %(error)s") % {"error": str(e)}
+        return False, _SEND_FAILED % {"error": str(e)}
 
 
+@_timed("resend.send_email")
 def send_email(to_email: str, subject: str, html_content: str) -> tuple[bool, str]:
     """
     Send an email using the configured Resend API.
@@ -129,47 +348,141 @@ def send_email(to_email: str, subject: str, html_content: str) -> tuple[bool, st
         from settings_config.services import send_email
         success, msg = send_email("user@example.com", "Welcome!", "<h1>Welcome</h1>")
     """
+    if not _EMAIL_RE.match(to_email):
+        return False, _INVALID_RECIPIENT
+
     config = get_resend_config()
     if not config:
-        return False, _("Email service is not configured.")
+        return False, _EMAIL_NOT_CONFIGURED
+
+    if not config.from_email:
+        return False, _FROM_EMAIL_MISSING
 
     try:
-        response = requests.post(
-            "https://api.resend.com/emails",
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "Content-Type": "application/json",
-            },
+        response = _resend_session.post(
+            RESEND_EMAILS_URL,
+            headers=_resend_headers(config),
             json={
-                "from": f"{config.from_name} <{config.from_email}>"
-                if config.from_name
-                else config.from_email,
+                "from": config.from_address,
                 "to": [to_email],
                 "subject": subject,
                 "html": html_content,
             },
-            timeout=10,
+            timeout=RESEND_TIMEOUT,
         )
 
-        if response.status_code == 200:
-            return True, _("Email sent successfully.")
+        if _resend_succeeded(response):
+            return True, _EMAIL_SENT
         else:
-            error_data = response.json()
-            error_message = error_data.get("message", response.text)
-            logger.error(f"Resend API error: {error_message}")
-            return False, _("Failed to send email: %(error)s") % {
-                "error": error_message
-            }
+            error_message = _resend_error_message(response)
+            logger.error("Resend API error: %s", error_message)
+            return False, _SEND_FAILED % {"error": error_message}
 
     except requests.exceptions.RequestException as e:
         logger.exception("Error sending email")
-        return False, _("Failed to send email: %(error)s") % {"error": str(e)}
+        return False, _SEND_FAILED % {"error": str(e)}
+
+
+def _send_email_task(to_email, subject, html_content):
+    try:
+        return send_email(to_email, subject, html_content)
+    finally:
+        connections.close_all()
+
+
+def send_email_async(to_email: str, subject: str, html_content: str) -> Future:
+    """
+    Send an email in a background thread without waiting for the Resend API.
+
+    The email is sent right away, even if the current transaction is later
+    rolled back. Use run_in_background(send_email, ...) to send on commit.
+
+    Returns:
+        Future resolving to the (success: bool, message: str) of send_email()
+
+    Usage:
+        from settings_config.services import send_email_async
+        send_email_async("user@example.com", "Welcome!", "<h1>Welcome</h1>")
+    """
+    return _email_executor.submit(_send_email_task, to_email, subject, html_content)
+
+
+def send_emails_bulk(messages: list[dict]) -> list[tuple[bool, str]]:
+    """
+    Send several emails using the configured Resend batch API.
+
+    Messages are sent in batches of RESEND_BATCH_SIZE per request. Resend
+    accepts or rejects a batch as a whole, so every message in a batch gets
+    the same result. Malformed recipients are rejected without being sent.
+
+    Args:
+        messages: List of dicts with to_email, subject and html_content keys
+
+    Returns:
+        List of (success: bool, message: str) tuples, in the order of messages
+
+    Usage:
+        from settings_config.services import send_emails_bulk
+        results = send_emails_bulk([
+            {"to_email": "user@example.com", "subject": "Hi", "html_content": "<p>Hi</p>"},
+        ])
+    """
+    config = get_resend_config()
+    if not config:
+        return [(False, _EMAIL_NOT_CONFIGURED)] * len(messages)
+
+    if not config.from_email:
+        return [(False, _FROM_EMAIL_MISSING)] * len(messages)
+
+    results = [None] * len(messages)
+    to_send = []
+    for index, message in enumerate(messages):
+        if _EMAIL_RE.match(message["to_email"]):
+            to_send.append(index)
+        else:
+            results[index] = False, _INVALID_RECIPIENT
+
+    for start in range(0, len(to_send), RESEND_BATCH_SIZE):
+        batch = to_send[start : start + RESEND_BATCH_SIZE]
+        try:
+            response = _resend_session.post(
+                RESEND_BATCH_URL,
+                headers=_resend_headers(config),
+                json=[
+                    {
+                        "from": config.from_address,
+                        "to": [messages[index]["to_email"]],
+                        "subject": messages[index]["subject"],
+                        "html": messages[index]["html_content"],
+                    }
+                    for index in batch
+                ],
+                timeout=RESEND_TIMEOUT,
+            )
+
+            if _resend_succeeded(response):
+                result = True, _EMAIL_SENT
+            else:
+                error_message = _resend_error_message(response)
+                logger.error("Resend API error: %s", error_message)
+                result = False, _SEND_FAILED % {"error": error_message}
+
+        except requests.exceptions.RequestException as e:
+            logger.exception("Error sending email batch")
+            result = False, _SEND_FAILED % {"error": str(e)}
+
+        for index in batch:
+            results[index] = result
+    return results
 
 
-def get_tinymce_config():
+def get_tinymce_config(use_local_cache=True):
     """
     Retrieve TinyMCE configuration from database.
 
+    Args:
+        use_local_cache: Reuse this process's copy of the cached configuration
+
     Returns:
         TinyMCEConfiguration instance or None if not active.
 
@@ -180,18 +493,48 @@ def get_tinymce_config():
             mce_config = config.get_config_dict()
             js_url = config.get_js_url()
     """
-    from .models import TinyMCEConfiguration
-
-    config = TinyMCEConfiguration.load()
+    config = TinyMCEConfiguration.load(use_local_cache)
     if config.is_active and config.api_key:
         return config
     return None
 
 
-def get_cloudinary_config():
+def _build_tinymce_editor_context():
+    config = get_tinymce_config(use_local_cache=False)
+    if not config:
+        return {}
+    return {
+        "tinymce_config": config.get_config_dict(),
+        "tinymce_js_url": config.get_js_url(),
+    }
+
+
+def get_tinymce_editor_context():
+    """
+    Retrieve the template context for rendering the TinyMCE editor.
+
+    The result is cached and cleared whenever the configuration is saved.
+
+    Returns:
+        dict with tinymce_config and tinymce_js_url, or an empty dict
+        if TinyMCE is not active.
+
+    Usage:
+        from settings_config.services import get_tinymce_editor_context
+        extra_context.update(get_tinymce_editor_context())
+    """
+    return cache.get_or_set(
+        TINYMCE_EDITOR_CACHE_KEY, _build_tinymce_editor_context, timeout=300
+    )
+
+
+def get_cloudinary_config(use_local_cache=True):
     """
     Retrieve Cloudinary configuration from database.
 
+    Args:
+        use_local_cache: Reuse this process's copy of the cached configuration
+
     Returns:
         CloudinaryConfiguration instance or None if not active.
 
@@ -201,14 +544,30 @@ def get_cloudinary_config():
         if config:
             config.configure()  # Configures cloudinary library
     """
-    from .models import CloudinaryConfiguration
-
-    config = CloudinaryConfiguration.load()
+    config = CloudinaryConfiguration.load(use_local_cache)
     if config.is_active and config.cloud_name and config.api_key and config.api_secret:
         return config
     return None
 
 
+def is_cloudinary_configured() -> bool:
+    """
+    Check whether Cloudinary is configured and active.
+
+    The result is cached and cleared whenever the configuration is saved.
+
+    Usage:
+        from settings_config.services import is_cloudinary_configured
+        if not is_cloudinary_configured():
+            field.disabled = True
+    """
+    return cache.get_or_set(
+        CLOUDINARY_CONFIGURED_CACHE_KEY,
+        lambda: get_cloudinary_config(use_local_cache=False) is not None,
+        timeout=60,
+    )
+
+
 def configure_cloudinary():
     """
     Configure the cloudinary library with database settings.
@@ -230,6 +589,44 @@ def configure_cloudinary():
     return False
 
 
+def _cloudinary_upload_params(config, folder, transformation, timeout):
+    upload_params = {
+        "folder": folder or config.default_folder,
+        "resource_type": "image",
+        "timeout": timeout,
+    }
+    if config.auto_optimize:
+        transformation = {**CLOUDINARY_AUTO_OPTIMIZE, **(transformation or {})}
+    if transformation:
+        upload_params["transformation"] = transformation
+    return upload_params
+
+
+def _upload_file_to_cloudinary(image_file, upload_params):
+    try:
+        if isinstance(image_file, str) and os.path.isfile(image_file):
+            size = os.path.getsize(image_file)
+        else:
+            size = getattr(image_file, "size", None)
+        if size is not None and size > CLOUDINARY_LARGE_UPLOAD_SIZE:
+            # Read from disk chunk by chunk instead of buffering the whole file
+            if hasattr(image_file, "temporary_file_path"):
+                image_file = image_file.temporary_file_path()
+            result = cloudinary.uploader.upload_large(
+                image_file,
+                chunk_size=CLOUDINARY_UPLOAD_CHUNK_SIZE,
+                **upload_params,
+            )
+        else:
+            result = cloudinary.uploader.upload(image_file, **upload_params)
+        return result.get("secure_url")
+
+    except Exception as e:
+        logger.exception("Cloudinary upload error: %s", e)
+        return None
+
+
+@_timed("cloudinary.upload")
 def upload_to_cloudinary(
     image_file,
     folder: str | None = None,
@@ -240,7 +637,9 @@ def upload_to_cloudinary(
     Upload image to Cloudinary using database configuration.
 
     Args:
-        image_file: Django ImageField file or file path
+        image_file: Django ImageField file or file path, files above
+            CLOUDINARY_LARGE_UPLOAD_SIZE are read from disk in chunks when
+            given as a path or a temporary upload
         folder: Cloudinary folder path (uses default from config if not provided)
         transformation: Optional dict with width, height, crop settings
         timeout: Upload timeout in seconds (default: 30)
@@ -257,39 +656,61 @@ def upload_to_cloudinary(
         logger.error("Cloudinary is not configured")
         return None
 
-    try:
-        import cloudinary
-        import cloudinary.uploader
+    config.configure()
+    upload_params = _cloudinary_upload_params(config, folder, transformation, timeout)
+    return _upload_file_to_cloudinary(image_file, upload_params)
 
-        # Configure cloudinary
-        config.configure()
 
-        upload_params = {
-            "folder": folder or config.default_folder,
-            "resource_type": "image",
-            "timeout": timeout,
-        }
-
-        if config.auto_optimize:
-            upload_params["transformation"] = {
-                "quality": "auto:good",
-                "fetch_format": "auto",
-            }
-
-        if transformation:
-            if "transformation" in upload_params:
-                upload_params["transformation"].update(transformation)
-            else:
-                upload_params["transformation"] = transformation
+def upload_many_to_cloudinary(
+    image_files,
+    folder: str | None = None,
+    transformation: dict | None = None,
+    timeout: int = 30,
+    concurrency: int = 8,
+) -> list[str | None]:
+    """
+    Upload several images to Cloudinary in parallel.
 
-        result = cloudinary.uploader.upload(image_file, **upload_params)
-        return result.get("secure_url")
+    Args:
+        image_files: Django ImageField files or file paths
+        folder: Cloudinary folder path (uses default from config if not provided)
+        transformation: Optional dict with width, height, crop settings
+        timeout: Upload timeout in seconds per image (default: 30)
+        concurrency: Number of uploads to run at once (default: 8)
 
-    except Exception as e:
-        logger.exception(f"Cloudinary upload error: {e}")
-        return None
+    Returns:
+        list: Cloudinary URL or None for each image, in the order given
+
+    Usage:
+        from settings_config.services import upload_many_to_cloudinary
+        urls = upload_many_to_cloudinary(request.FILES.getlist('images'))
+    """
+    config = get_cloudinary_config()
+    if not config:
+        logger.error("Cloudinary is not configured")
+        return [None] * len(image_files)
+
+    config.configure()
+    upload_params = _cloudinary_upload_params(config, folder, transformation, timeout)
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="cloudinary"
+    ) as executor:
+        return list(
+            executor.map(
+                lambda image_file: _upload_file_to_cloudinary(
+                    image_file, upload_params
+                ),
+                image_files,
+            )
+        )
 
 
+def _cloudinary_public_id(url):
+    match = _CLOUDINARY_URL_RE.match(url)
+    return match[1] if match else None
+
+
+@_timed("cloudinary.delete")
 def delete_from_cloudinary(url: str) -> bool:
     """
     Delete an image from Cloudinary using its URL.
@@ -310,27 +731,59 @@ def delete_from_cloudinary(url: str) -> bool:
         return False
 
     try:
-        import cloudinary
-        import cloudinary.uploader
-
         config.configure()
 
-        # Extract public_id from URL
-        parts = url.split("/")
-        if "cloudinary.com" in url and len(parts) >= 2:
-            upload_index = parts.index("upload")
-            public_id_parts = parts[upload_index + 1 :]
-            # Remove version if present
-            if public_id_parts[0].startswith("v"):
-                public_id_parts = public_id_parts[1:]
-            public_id = "/".join(public_id_parts)
-            # Remove file extension
-            public_id = public_id.rsplit(".", 1)[0]
-
-            result = cloudinary.uploader.destroy(public_id)
-            return result.get("result") == "ok"
-        return False
+        public_id = _cloudinary_public_id(url)
+        if public_id is None:
+            return False
+        result = cloudinary.uploader.destroy(public_id)
+        return result.get("result") == "ok"
 
     except Exception as e:
-        logger.exception(f"Cloudinary delete error: {e}")
+        logger.exception("Cloudinary delete error: %s", e)
         return False
+
+
+def delete_many_from_cloudinary(urls) -> dict[str, bool]:
+    """
+    Delete several images from Cloudinary using their URLs.
+
+    Images are deleted in batches of CLOUDINARY_DELETE_BATCH_SIZE per
+    request through the Admin API, which is rate limited separately from
+    uploads.
+
+    Args:
+        urls: The Cloudinary URLs of the images to delete
+
+    Returns:
+        dict: Whether each URL was deleted, keyed by URL
+
+    Usage:
+        from settings_config.services import delete_many_from_cloudinary
+        results = delete_many_from_cloudinary(old_image_urls)
+    """
+    results = dict.fromkeys(urls, False)
+    config = get_cloudinary_config()
+    if not config:
+        logger.error("Cloudinary is not configured")
+        return results
+
+    public_ids = {}
+    for url in results:
+        public_id = _cloudinary_public_id(url)
+        if public_id is not None:
+            public_ids.setdefault(public_id, []).append(url)
+
+    config.configure()
+    ids = list(public_ids)
+    for start in range(0, len(ids), CLOUDINARY_DELETE_BATCH_SIZE):
+        batch = ids[start : start + CLOUDINARY_DELETE_BATCH_SIZE]
+        try:
+            deleted = cloudinary.api.delete_resources(batch, resource_type="image")
+        except Exception as e:
+            logger.exception("Cloudinary delete error: %s", e)
+            continue
+        for public_id, status in deleted.get("deleted", {}).items():
+            for url in public_ids.get(public_id, ()):
+                results[url] = status == "deleted"
+    return results
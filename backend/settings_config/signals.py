@@ -0,0 +1,27 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CloudinaryConfiguration, TinyMCEConfiguration
+from .services import CLOUDINARY_CONFIGURED_CACHE_KEY, TINYMCE_EDITOR_CACHE_KEY
+
+
+@receiver([post_save, post_delete], sender=TinyMCEConfiguration)
+def clear_tinymce_editor_cache(sender, **kwargs):
+    """
+    Drop the cached editor context when the TinyMCE configuration changes,
+    and again on commit in case another request cached the old one meanwhile.
+    """
+    cache.delete(TINYMCE_EDITOR_CACHE_KEY)
+    transaction.on_commit(lambda: cache.delete(TINYMCE_EDITOR_CACHE_KEY))
+
+
+@receiver([post_save, post_delete], sender=CloudinaryConfiguration)
+def clear_cloudinary_configured_cache(sender, **kwargs):
+    """
+    Drop the cached availability flag when the Cloudinary configuration
+    changes, and again on commit in case another request cached the old one.
+    """
+    cache.delete(CLOUDINARY_CONFIGURED_CACHE_KEY)
+    transaction.on_commit(lambda: cache.delete(CLOUDINARY_CONFIGURED_CACHE_KEY))
@@ -0,0 +1,80 @@
+import pytest
+from django.core.cache import cache
+
+from settings_config.models import (
+    CloudinaryConfiguration,
+    ResendConfiguration,
+    StripeConfiguration,
+    _local_cache,
+)
+from settings_config.services import (
+    CLOUDINARY_CONFIGURED_CACHE_KEY,
+    is_cloudinary_configured,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    _local_cache.clear()
+    yield
+    cache.clear()
+    _local_cache.clear()
+
+
+@pytest.mark.django_db
+def test_singleton_save_is_single_update(django_assert_num_queries):
+    config = StripeConfiguration.load()
+    config.is_active = True
+    with django_assert_num_queries(1) as captured:
+        config.save()
+    assert captured.captured_queries[0]["sql"].startswith("UPDATE")
+    assert StripeConfiguration.load().is_active
+
+
+@pytest.mark.django_db
+def test_singleton_cache_cleared_on_commit(django_capture_on_commit_callbacks):
+    config = StripeConfiguration.load()
+    with django_capture_on_commit_callbacks(execute=True):
+        config.is_active = True
+        config.save()
+        # Stale copy cached by a concurrent request before the commit
+        cache.set("StripeConfiguration_singleton", {"id": 1, "is_active": False})
+    _local_cache.clear()
+    assert StripeConfiguration.load().is_active
+
+
+@pytest.mark.django_db
+def test_cloudinary_flag_cleared_on_commit(django_capture_on_commit_callbacks):
+    assert not is_cloudinary_configured()
+    config = CloudinaryConfiguration.load()
+    with django_capture_on_commit_callbacks(execute=True):
+        config.is_active = True
+        config.cloud_name, config.api_key, config.api_secret = "demo", "key", "secret"
+        config.save()
+        # Stale flag cached by a concurrent request before the commit
+        cache.set(CLOUDINARY_CONFIGURED_CACHE_KEY, False)
+    _local_cache.clear()
+    assert is_cloudinary_configured()
+
+
+@pytest.mark.django_db
+def test_singleton_load_matches_cached_values_by_name():
+    config = ResendConfiguration.load()
+    config.from_email = "team@example.com"
+    config.from_name = "Team"
+    config.save()
+    data = {
+        "legacy": "removed field",
+        **{
+            field.attname: getattr(config, field.attname)
+            for field in ResendConfiguration._meta.concrete_fields
+            if field.attname != "from_name"
+        },
+    }
+    cache.set("ResendConfiguration_singleton", data)
+    _local_cache.clear()
+
+    loaded = ResendConfiguration.load()
+    assert loaded.from_email == "team@example.com"
+    assert loaded.from_name == "Team"
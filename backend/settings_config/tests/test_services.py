@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from settings_config import services
+from settings_config.services import _cloudinary_public_id
+
+
+def make_response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def resend_config(monkeypatch):
+    config = SimpleNamespace(
+        api_key="re_test", from_email="no-reply@example.com", from_address="Test"
+    )
+    monkeypatch.setattr(services, "get_resend_config", lambda: config)
+    return config
+
+
+@pytest.fixture
+def cloudinary_config(monkeypatch):
+    config = SimpleNamespace(configure=lambda: None)
+    monkeypatch.setattr(services, "get_cloudinary_config", lambda: config)
+    return config
+
+
+@pytest.mark.parametrize(
+    "url, public_id",
+    [
+        (
+            "https://res.cloudinary.com/demo/image/upload/v1712345678/blog/a.png",
+            "blog/a",
+        ),
+        ("https://res.cloudinary.com/demo/image/upload/blog/a.b.jpg", "blog/a.b"),
+        ("https://res.cloudinary.com/demo/image/upload/v1/vacation", "vacation"),
+        ("https://example.com/image/upload/a.png", None),
+    ],
+)
+def test_cloudinary_public_id(url, public_id):
+    assert _cloudinary_public_id(url) == public_id
+
+
+def test_send_emails_bulk_batches_in_order(resend_config, monkeypatch):
+    monkeypatch.setattr(services, "RESEND_BATCH_SIZE", 2)
+    batches = []
+    responses = iter(
+        [
+            make_response(200, b'{"data": []}'),
+            make_response(422, b'{"message": "Invalid subject"}'),
+        ]
+    )
+
+    def post(url, json, **kwargs):
+        batches.append([email["to"] for email in json])
+        return next(responses)
+
+    monkeypatch.setattr(services._resend_session, "post", post)
+    recipients = ["a@example.com", "bad", "b@example.com", "c@example.com", "nope@"]
+    results = services.send_emails_bulk(
+        [
+            {"to_email": to, "subject": "Hi", "html_content": "<p>Hi</p>"}
+            for to in recipients
+        ]
+    )
+
+    assert batches == [[["a@example.com"], ["b@example.com"]], [["c@example.com"]]]
+    failed = services._SEND_FAILED % {"error": "Invalid subject"}
+    assert results == [
+        (True, services._EMAIL_SENT),
+        (False, services._INVALID_RECIPIENT),
+        (True, services._EMAIL_SENT),
+        (False, failed),
+        (False, services._INVALID_RECIPIENT),
+    ]
+
+
+def test_send_emails_bulk_non_json_error(resend_config, monkeypatch):
+    monkeypatch.setattr(
+        services._resend_session,
+        "post",
+        lambda *args, **kwargs: make_response(502, b"<html>Bad Gateway</html>"),
+    )
+    results = services.send_emails_bulk(
+        [{"to_email": "a@example.com", "subject": "Hi", "html_content": ""}]
+    )
+    error = "<html>Bad Gateway</html>"
+    assert results == [(False, services._SEND_FAILED % {"error": error})]
+
+
+def test_delete_many_from_cloudinary(cloudinary_config, monkeypatch):
+    monkeypatch.setattr(services, "CLOUDINARY_DELETE_BATCH_SIZE", 1)
+    batches = []
+
+    def delete_resources(public_ids, **kwargs):
+        batches.append(public_ids)
+        status = "not_found" if public_ids == ["blog/b"] else "deleted"
+        return {"deleted": dict.fromkeys(public_ids, status)}
+
+    monkeypatch.setattr(services.cloudinary.api, "delete_resources", delete_resources)
+    a = "https://res.cloudinary.com/demo/image/upload/v1/blog/a.png"
+    b = "https://res.cloudinary.com/demo/image/upload/v1/blog/b.png"
+    results = services.delete_many_from_cloudinary(
+        [a, b, a, a.replace("v1", "v2"), "https://example.com/c.png"]
+    )
+
+    assert batches == [["blog/a"], ["blog/b"]]
+    assert results == {
+        a: True,
+        b: False,
+        a.replace("v1", "v2"): True,
+        "https://example.com/c.png": False,
+    }